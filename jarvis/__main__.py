@@ -8,20 +8,28 @@ Usage:
     python -m jarvis --config /path/to/config.yaml
     python -m jarvis --voice            # voice assistant mode
     python -m jarvis --voice-test       # test voice components
+    python -m jarvis --loop asyncio     # use the stdlib event loop instead of uvloop
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import importlib.util
+import io
 import sys
+import time
 import uuid
 
+from prompt_toolkit import PromptSession
+from prompt_toolkit.formatted_text import HTML
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
 from jarvis import __app_name__, __version__
+from jarvis.ai.model_router import ModelConfig, ModelRouter
 from jarvis.core.config import load_config
 from jarvis.core.orchestrator import JarvisOrchestrator
 
@@ -36,17 +44,44 @@ _BANNER = r"""
  ╚════╝ ╚═╝  ╚═╝╚═╝  ╚═╝  ╚═══╝  ╚═╝╚══════╝    ╚═╝  ╚═╝
 """
 
+_STREAM_REFRESH_INTERVAL = 1 / 30  # seconds between redraws while streaming
+_EXIT_COMMANDS = frozenset({"exit", "quit", "chiqish"})
+_PROMPT = HTML("<ansicyan><b>You:</b></ansicyan> ")
+
+
+class _FixedRouter(ModelRouter):
+    """Router that always picks the model forced via --model, if it is registered."""
+
+    def __init__(self, forced: str, registry: list[ModelConfig] | None = None) -> None:
+        super().__init__(registry)
+        self._forced = forced
+
+    def select_model(
+        self,
+        user_input: str,
+        force_offline: bool = False,
+        available_providers: list[str] | None = None,
+        normalized: str | None = None,
+    ) -> ModelConfig:
+        forced = self.get(self._forced)
+        if forced is not None:
+            return forced
+        # Fallback: default selection
+        return super().select_model(user_input, force_offline, available_providers, normalized)
+
+
+_BANNER_TEXT = Text(_BANNER, style="bold cyan")
+_BANNER_PANEL = Panel(
+    f"[bold green]{__app_name__} v{__version__}[/bold green] — "
+    "Next-gen AI assistant (EN/UZ)\n"
+    "[dim]Type 'exit', 'quit', or 'chiqish' to leave.[/dim]",
+    border_style="cyan",
+)
+
 
 def _print_banner() -> None:
-    console.print(Text(_BANNER, style="bold cyan"))
-    console.print(
-        Panel(
-            f"[bold green]{__app_name__} v{__version__}[/bold green] — "
-            "Next-gen AI assistant (EN/UZ)\n"
-            "[dim]Type 'exit', 'quit', or 'chiqish' to leave.[/dim]",
-            border_style="cyan",
-        )
-    )
+    console.print(_BANNER_TEXT)
+    console.print(_BANNER_PANEL)
 
 
 async def _run_single(
@@ -54,28 +89,15 @@ async def _run_single(
     message: str,
     session_id: str,
     force_offline: bool,
-    force_model: str | None,
+    normalized: str | None = None,
 ) -> None:
     """Send a single message and print the response."""
-    if force_model:
-        # Override model selection to always return the specified model
-        from jarvis.ai.model_router import ModelConfig, ModelRouter
-
-        class _FixedRouter(ModelRouter):
-            def select_model(self, user_input: str, force_offline: bool = False) -> ModelConfig:
-                for m in self._registry:
-                    if m.name == force_model:
-                        return m
-                # Fallback: default selection
-                return super().select_model(user_input, force_offline)
-
-        orchestrator.set_router(_FixedRouter())
-
     with console.status("[bold cyan]Thinking…[/bold cyan]", spinner="dots"):
         result = await orchestrator.process_message(
             user_input=message,
             session_id=session_id,
             force_offline=force_offline,
+            normalized_input=normalized,
         )
 
     console.print()
@@ -94,37 +116,46 @@ async def _run_single_stream(
     session_id: str,
     force_offline: bool,
 ) -> None:
-    """Send a single message and stream the response."""
+    """Send a single message and render the response as it streams in."""
+    buf = io.StringIO()
+
+    def _panel(title: str) -> Panel:
+        return Panel(Text(buf.getvalue(), style="green"), title=title, border_style="green")
+
     console.print()
-    with console.status("[bold cyan]Streaming…[/bold cyan]", spinner="dots"):
-        chunks: list[str] = []
+    # No auto-refresh thread: redraw only when new text arrives, at most 30 times/s
+    with Live(_panel("[dim]streaming…[/dim]"), console=console, auto_refresh=False) as live:
+        last_refresh = 0.0
         async for chunk in orchestrator.process_stream(
             user_input=message,
             session_id=session_id,
             force_offline=force_offline,
         ):
-            chunks.append(chunk)
-    console.print(
-        Panel(
-            Text("".join(chunks), style="green"),
-            title="[dim]streamed[/dim]",
-            border_style="green",
-        )
-    )
+            buf.write(chunk)
+            now = time.monotonic()
+            if now - last_refresh >= _STREAM_REFRESH_INTERVAL:
+                live.update(_panel("[dim]streaming…[/dim]"), refresh=True)
+                last_refresh = now
+        live.update(_panel("[dim]streamed[/dim]"))
 
 
 async def _repl(
     orchestrator: JarvisOrchestrator,
+    ready: asyncio.Task[None],
     force_offline: bool,
-    force_model: str | None,
 ) -> None:
-    """Interactive REPL mode."""
+    """Interactive REPL mode.
+
+    The prompt is shown straight away; *ready* (the orchestrator's initialization
+    task) is only awaited once the first message needs to be answered.
+    """
     _print_banner()
     session_id = str(uuid.uuid4())
+    prompt = PromptSession()
 
     while True:
         try:
-            user_input = console.input("[bold cyan]You:[/bold cyan] ").strip()
+            user_input = (await prompt.prompt_async(_PROMPT)).strip()
         except (EOFError, KeyboardInterrupt):
             console.print("\n[dim]Goodbye! / Xayr![/dim]")
             break
@@ -132,11 +163,13 @@ async def _repl(
         if not user_input:
             continue
 
-        if user_input.lower() in {"exit", "quit", "chiqish"}:
+        lowered = user_input.lower()
+        if lowered in _EXIT_COMMANDS:
             console.print("[dim]Goodbye! / Xayr![/dim]")
             break
 
-        await _run_single(orchestrator, user_input, session_id, force_offline, force_model)
+        await ready
+        await _run_single(orchestrator, user_input, session_id, force_offline, lowered)
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -154,9 +187,32 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--voice-test", action="store_true", help="Test voice components (STT, TTS, mic)"
     )
+    parser.add_argument(
+        "--loop",
+        choices=["uvloop", "asyncio"],
+        default="uvloop",
+        help="Event loop implementation (falls back to asyncio if uvloop is unavailable)",
+    )
     return parser
 
 
+def _install_event_loop(loop: str) -> str:
+    """Install the requested event loop policy and return the name of the loop in use."""
+    if loop != "uvloop":
+        return "asyncio"
+    try:
+        import uvloop  # type: ignore[import]
+    except ImportError:
+        return "asyncio"
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
+
+
+def _http_implementation() -> str:
+    """Return uvicorn's C-accelerated HTTP parser if installed, else the pure-Python one."""
+    return "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+
+
 def _run_voice_test() -> None:
     """Test each voice component and report status."""
     from jarvis.voice.audio_stream import AudioStream
@@ -185,6 +241,7 @@ def _run_voice_test() -> None:
 def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
+    loop = _install_event_loop(args.loop)
 
     if args.api:
         try:
@@ -197,6 +254,8 @@ def main() -> None:
             host="0.0.0.0",
             port=8000,
             reload=False,
+            loop=loop,
+            http=_http_implementation(),
         )
         return
 
@@ -227,7 +286,10 @@ def main() -> None:
                     "  bash scripts/download_vosk_model.sh"
                 )
                 return
-            await assistant.run_voice_loop()
+            try:
+                await assistant.run_voice_loop()
+            finally:
+                await orchestrator.shutdown()
 
         try:
             asyncio.run(_run_voice())
@@ -236,9 +298,22 @@ def main() -> None:
             sys.exit(0)
         return
 
-    async def _run() -> None:
+    async def _initialize() -> None:
         await orchestrator.initialize()
+        if args.model:
+            orchestrator.set_router(_FixedRouter(args.model))
+
+    async def _run() -> None:
+        ready = asyncio.create_task(_initialize())
+        try:
+            await _dispatch(ready)
+        finally:
+            await ready
+            await orchestrator.shutdown()
+
+    async def _dispatch(ready: asyncio.Task[None]) -> None:
         if args.message:
+            await ready
             session_id = str(uuid.uuid4())
             if args.stream:
                 await _run_single_stream(
@@ -253,10 +328,9 @@ def main() -> None:
                     args.message,
                     session_id,
                     force_offline=args.offline,
-                    force_model=args.model,
                 )
         else:
-            await _repl(orchestrator, force_offline=args.offline, force_model=args.model)
+            await _repl(orchestrator, ready, force_offline=args.offline)
 
     try:
         asyncio.run(_run())
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 
 class TaskComplexity(Enum):
@@ -137,42 +139,104 @@ _TRIVIAL_KEYWORDS = {
 }
 
 
+def _compile_keywords(keywords: set[str]) -> re.Pattern[str]:
+    """Compile a keyword set into a single alternation anchored at word starts.
+
+    There is no trailing boundary, so stems also match suffixed forms
+    ("tushuntir" in "tushuntiring", "explain" in "explained").
+    """
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})")
+
+
+_COMPLEX_RE = _compile_keywords(_COMPLEX_KEYWORDS)
+_TRIVIAL_RE = _compile_keywords(_TRIVIAL_KEYWORDS)
+
+# Prompts longer than this many words are classified COMPLEX without a keyword scan
+_LONG_PROMPT_WORDS = 20
+
+
+@lru_cache(maxsize=2048)
+def _classify(text: str) -> TaskComplexity:
+    """Classify normalized (lowercased, stripped) text; cached across calls.
+
+    Prompts over ``_LONG_PROMPT_WORDS`` words are handled by the caller.
+    """
+    word_count = len(text.split())
+
+    has_trivial = _TRIVIAL_RE.search(text) is not None
+
+    # Trivial: very short greetings / one-word answers
+    if word_count <= 3 and has_trivial:
+        return TaskComplexity.TRIVIAL
+
+    if has_trivial:
+        return TaskComplexity.SIMPLE
+
+    # Complex: contains complex keywords
+    if _COMPLEX_RE.search(text):
+        return TaskComplexity.COMPLEX
+
+    # Moderate: everything else of reasonable length
+    if word_count > 8:
+        return TaskComplexity.MODERATE
+
+    return TaskComplexity.SIMPLE
+
+
 class ModelRouter:
     """Chooses the right model based on task complexity and constraints."""
 
     def __init__(self, registry: list[ModelConfig] | None = None) -> None:
         self._registry = registry or _MODEL_REGISTRY
+        self._by_name: dict[str, ModelConfig] = {m.name: m for m in self._registry}
+        # Parallel per-field views of the registry, scanned by index in select_model
+        self._latency = tuple(m.latency_ms for m in self._registry)
+        self._quality = tuple(m.quality_score for m in self._registry)
+        self._offline = tuple(m.offline_capable for m in self._registry)
+        self._provider = tuple(m.provider for m in self._registry)
+        # Fallback order, sorted once (sorted() is stable, so ties keep registry order)
+        self._by_latency = tuple(sorted(self._registry, key=lambda m: m.latency_ms))
+        self._offline_by_latency = tuple(m for m in self._by_latency if m.offline_capable)
+        # (prefer_fast, force_offline, providers) -> chosen model; the registry is static
+        self._selection_cache: dict[tuple[bool, bool, frozenset[str] | None], ModelConfig] = {}
 
-    def get_models_except(self, model_name: str) -> list[ModelConfig]:
-        """Return all registered models except the one with the given name."""
-        return [m for m in self._registry if m.name != model_name]
+    def get(self, model_name: str) -> ModelConfig | None:
+        """Return the registered model with the given name, or None."""
+        return self._by_name.get(model_name)
 
-    def classify_task(self, user_input: str) -> TaskComplexity:
-        """Keyword-based heuristic to classify task complexity."""
-        text = user_input.lower().strip()
+    def get_models_except(
+        self, model_name: str, offline_only: bool = False
+    ) -> list[ModelConfig]:
+        """Return registered models other than *model_name*, fastest first.
 
-        # Trivial: very short greetings / one-word answers
-        if len(text.split()) <= 3 and any(kw in text for kw in _TRIVIAL_KEYWORDS):
-            return TaskComplexity.TRIVIAL
+        Args:
+            model_name: Model to exclude.
+            offline_only: If True, return only offline-capable models.
+        """
+        pool = self._offline_by_latency if offline_only else self._by_latency
+        return [m for m in pool if m.name != model_name]
 
-        if any(kw in text for kw in _TRIVIAL_KEYWORDS):
-            return TaskComplexity.SIMPLE
+    def classify_task(self, user_input: str, normalized: str | None = None) -> TaskComplexity:
+        """Keyword-based heuristic to classify task complexity.
 
-        # Complex: contains complex keywords or is long
-        if any(kw in text for kw in _COMPLEX_KEYWORDS) or len(text.split()) > 20:
+        *normalized* may carry ``user_input.lower().strip()`` when the caller
+        already computed it.
+        """
+        text = user_input if normalized is None else normalized
+        # Decide long prompts up front: no lowercasing, and they stay out of the cache
+        if len(text.split()) > _LONG_PROMPT_WORDS:
             return TaskComplexity.COMPLEX
-
-        # Moderate: everything else of reasonable length
-        if len(text.split()) > 8:
-            return TaskComplexity.MODERATE
-
-        return TaskComplexity.SIMPLE
+        if normalized is None:
+            normalized = user_input.strip().lower()
+        return _classify(normalized)
 
     def select_model(
         self,
         user_input: str,
         force_offline: bool = False,
         available_providers: list[str] | None = None,
+        normalized: str | None = None,
     ) -> ModelConfig:
         """Select the best model for the given input.
 
@@ -180,6 +244,7 @@ class ModelRouter:
             user_input: The user's message.
             force_offline: If True, only consider offline-capable models.
             available_providers: If given, only consider models from these providers.
+            normalized: Optional pre-lowercased, stripped copy of user_input.
 
         Returns:
             The chosen ModelConfig.
@@ -187,24 +252,35 @@ class ModelRouter:
         Raises:
             RuntimeError: If no suitable model is found.
         """
-        complexity = self.classify_task(user_input)
-        candidates = self._registry
+        complexity = self.classify_task(user_input, normalized)
+        prefer_fast = complexity in (TaskComplexity.TRIVIAL, TaskComplexity.SIMPLE)
+        providers = frozenset(available_providers) if available_providers is not None else None
+        key = (prefer_fast, force_offline, providers)
+        cached = self._selection_cache.get(key)
+        if cached is not None:
+            return cached
+
+        candidates: range | list[int] = range(len(self._registry))
 
-        if available_providers is not None:
-            candidates = [m for m in candidates if m.provider in available_providers]
+        if providers is not None:
+            candidates = [i for i in candidates if self._provider[i] in providers]
             if not candidates:
                 raise RuntimeError(
                     f"No models available for providers: {available_providers}"
                 )
 
         if force_offline:
-            candidates = [m for m in candidates if m.offline_capable]
+            candidates = [i for i in candidates if self._offline[i]]
             if not candidates:
                 raise RuntimeError("No offline-capable models available.")
 
-        if complexity in (TaskComplexity.TRIVIAL, TaskComplexity.SIMPLE):
-            # Fastest model (lowest latency)
-            return min(candidates, key=lambda m: m.latency_ms)
+        if prefer_fast:
+            # TRIVIAL / SIMPLE: fastest model (lowest latency)
+            best = min(candidates, key=self._latency.__getitem__)
+        else:
+            # MODERATE / COMPLEX: highest quality
+            best = max(candidates, key=self._quality.__getitem__)
 
-        # MODERATE / COMPLEX: highest quality
-        return max(candidates, key=lambda m: m.quality_score)
+        chosen = self._registry[best]
+        self._selection_cache[key] = chosen
+        return chosen
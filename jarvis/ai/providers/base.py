@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 
 
 class ProviderError(Exception):
@@ -58,3 +59,72 @@ class BaseProvider(ABC):
     @abstractmethod
     def is_available(self) -> bool:
         """Return True if this provider is properly configured and ready."""
+
+    async def is_available_async(self) -> bool:
+        """Async variant of :meth:`is_available` for use on the event loop.
+
+        Providers whose check does I/O override this with a non-blocking probe.
+        """
+        return self.is_available()
+
+    async def warmup(self) -> None:
+        """Open network connections ahead of the first request (optional).
+
+        Implementations must not raise; failures simply leave the pool cold.
+        """
+
+
+async def coalesce_stream(
+    stream: AsyncIterator[str],
+    max_chars: int = 64,
+    max_delay: float = 0.01,
+) -> AsyncGenerator[str, None]:
+    """Merge small chunks from *stream* into larger ones.
+
+    A batch is emitted once it holds at least *max_chars* characters, or when a
+    chunk arrives *max_delay* seconds or more after the batch was started, and
+    at the end of the stream. The source is awaited directly, so batching adds
+    no task or timer per chunk; the flip side is that a partial batch waits for
+    the next chunk (or the end of the stream) if the source pauses.
+
+    Args:
+        stream: Source of text chunks (e.g. a provider's ``generate_stream``).
+        max_chars: Size threshold that flushes the current batch.
+        max_delay: Age at which the current batch is flushed on the next chunk.
+
+    Yields:
+        Concatenated text batches. If *stream* raises, the partial batch is
+        yielded first and the error is then re-raised.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = stream.__aiter__()
+    buf: list[str] = []
+    size = 0
+    deadline = 0.0
+    try:
+        while True:
+            try:
+                chunk = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Hand over what already arrived before surfacing the error
+                if buf:
+                    yield "".join(buf)
+                raise
+            if not buf:
+                deadline = loop.time() + max_delay
+            buf.append(chunk)
+            size += len(chunk)
+            if size >= max_chars or loop.time() >= deadline:
+                yield "".join(buf)
+                buf.clear()
+                size = 0
+        if buf:
+            yield "".join(buf)
+    finally:
+        # Close the source too, so e.g. a provider's HTTP stream is released now
+        # rather than when the generator is garbage-collected
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,29 @@
+"""Provider credentials and endpoints read from the environment."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class ProviderEnv:
+    groq_api_key: str | None
+    openrouter_api_key: str | None
+    ollama_base_url: str | None
+
+
+@lru_cache(maxsize=1)
+def provider_env() -> ProviderEnv:
+    """Return provider settings from the environment, read once and cached."""
+    return ProviderEnv(
+        groq_api_key=os.environ.get("GROQ_API_KEY"),
+        openrouter_api_key=os.environ.get("OPENROUTER_API_KEY"),
+        ollama_base_url=os.environ.get("OLLAMA_BASE_URL"),
+    )
+
+
+def invalidate_env_cache() -> None:
+    """Drop the cached values so providers created afterwards re-read the environment."""
+    provider_env.cache_clear()
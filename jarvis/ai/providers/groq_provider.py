@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
-import os
 from collections.abc import AsyncGenerator
 
 from groq import AsyncGroq, RateLimitError
 
 from jarvis.ai.providers.base import BaseProvider, ProviderError
+from jarvis.ai.providers.env import provider_env
 
 
 class GroqProvider(BaseProvider):
     """AI provider backed by the Groq API."""
 
     def __init__(self, api_key: str | None = None) -> None:
-        key = api_key or os.environ.get("GROQ_API_KEY")
+        key = api_key or provider_env().groq_api_key
         self._client: AsyncGroq | None = AsyncGroq(api_key=key) if key else None
 
     def is_available(self) -> bool:
         return self._client is not None
 
+    async def warmup(self) -> None:
+        """Open the Groq SDK's connection with a lightweight model listing."""
+        if not self._client:
+            return
+        try:
+            await self._client.models.list(timeout=2.0)
+        except Exception:
+            pass
+
     async def generate(
         self,
         messages: list[dict],
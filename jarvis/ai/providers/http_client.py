@@ -0,0 +1,80 @@
+"""Shared, pooled httpx client used by the HTTP-based providers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it lazily for the running event loop.
+
+    Connections are kept alive between requests, so only the first call to a host
+    pays the TCP/TLS handshake. A client created under a different event loop is
+    closed and replaced.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and _client_loop is not None and not _client.is_closed:
+            _discard_client(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=120.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        _client_loop = loop
+    return _client
+
+
+def _discard_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Release a client that belongs to another event loop.
+
+    If that loop is still running (in another thread) the client is closed on it.
+    Otherwise its sockets can no longer be closed through asyncio, so they are
+    closed directly; this reaches into httpx/httpcore internals and is best effort.
+    """
+    if loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    try:
+        pool = client._transport._pool  # type: ignore[attr-defined]
+        for conn in list(pool.connections):
+            stream = getattr(getattr(conn, "_connection", None), "_network_stream", None)
+            sock = stream.get_extra_info("socket") if stream is not None else None
+            if sock is not None:
+                # asyncio hands out a TransportSocket wrapper without close()
+                getattr(sock, "_sock", sock).close()
+    except Exception:
+        pass
+
+
+async def aclose_client() -> None:
+    """Close the shared client and drop its pooled connections."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def iter_lines(response: httpx.Response) -> AsyncGenerator[bytes, None]:
+    """Yield newline-delimited lines of a streamed *response* as raw bytes.
+
+    Splitting happens on the undecoded body, so callers can hand each line
+    straight to a bytes-accepting parser without a str round-trip.
+    """
+    buf = bytearray()
+    async for data in response.aiter_bytes():
+        buf += data
+        start = 0
+        while (end := buf.find(b"\n", start)) >= 0:
+            yield bytes(buf[start:end])
+            start = end + 1
+        del buf[:start]
+    if buf:
+        yield bytes(buf)
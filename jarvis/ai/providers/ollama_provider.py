@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import json
-import os
+import asyncio
+import time
 from collections.abc import AsyncGenerator
 
 import httpx
+import orjson
 
 from jarvis.ai.providers.base import BaseProvider, ProviderError
+from jarvis.ai.providers.env import provider_env
+from jarvis.ai.providers.http_client import get_client, iter_lines
 
 _DEFAULT_BASE_URL = "http://localhost:11434"
+_AVAILABILITY_TTL = 30.0  # seconds to trust a previous /api/tags probe
 
 
 class OllamaProvider(BaseProvider):
@@ -18,19 +22,53 @@ class OllamaProvider(BaseProvider):
 
     def __init__(self, base_url: str | None = None) -> None:
         self._base_url = (
-            base_url or os.environ.get("OLLAMA_BASE_URL") or _DEFAULT_BASE_URL
+            base_url or provider_env().ollama_base_url or _DEFAULT_BASE_URL
         ).rstrip("/")
+        self._available_cache: tuple[float, bool] | None = None
+        self._probe_lock = asyncio.Lock()
+
+    def _cached_availability(self) -> bool | None:
+        """Return the last probe result if it is still fresh, else None."""
+        cached = self._available_cache
+        if cached is not None and time.monotonic() - cached[0] < _AVAILABILITY_TTL:
+            return cached[1]
+        return None
 
     def is_available(self) -> bool:
-        """Return True if Ollama is running and reachable."""
-        try:
-            import httpx as _httpx
+        """Return True if Ollama is running and reachable (cached for a short TTL).
 
-            with _httpx.Client(timeout=3.0) as client:
+        This blocks on a network probe when the cache is stale; async code should
+        use :meth:`is_available_async` instead.
+        """
+        cached = self._cached_availability()
+        if cached is not None:
+            return cached
+        try:
+            with httpx.Client(timeout=3.0) as client:
                 resp = client.get(f"{self._base_url}/api/tags")
-                return resp.status_code == 200
+                available = resp.status_code == 200
         except Exception:
-            return False
+            available = False
+        self._available_cache = (time.monotonic(), available)
+        return available
+
+    async def is_available_async(self) -> bool:
+        """Non-blocking variant of :meth:`is_available`; concurrent probes are coalesced."""
+        cached = self._cached_availability()
+        if cached is not None:
+            return cached
+        async with self._probe_lock:
+            cached = self._cached_availability()
+            if cached is not None:
+                return cached
+            try:
+                resp = await get_client().get(f"{self._base_url}/api/tags", timeout=1.0)
+                available = resp.status_code == 200
+            except Exception:
+                # Same net as the sync probe: e.g. httpx.InvalidURL for a bad OLLAMA_HOST
+                available = False
+            self._available_cache = (time.monotonic(), available)
+            return available
 
     async def generate(
         self,
@@ -46,14 +84,14 @@ class OllamaProvider(BaseProvider):
             "options": {"num_predict": max_tokens, "temperature": temperature},
         }
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                resp = await client.post(
-                    f"{self._base_url}/api/chat", json=payload
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("message", {}).get("content", "")
+            resp = await get_client().post(
+                f"{self._base_url}/api/chat", json=payload, timeout=120.0
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            return data.get("message", {}).get("content", "")
         except httpx.ConnectError as exc:
+            self._available_cache = None
             raise ProviderError(
                 f"Cannot connect to Ollama at {self._base_url}. Is it running?"
             ) from exc
@@ -75,24 +113,24 @@ class OllamaProvider(BaseProvider):
             "stream": True,
         }
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                async with client.stream(
-                    "POST", f"{self._base_url}/api/chat", json=payload
-                ) as resp:
-                    resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if not line:
-                            continue
-                        try:
-                            chunk = json.loads(line)
-                            content = chunk.get("message", {}).get("content")
-                            if content:
-                                yield content
-                            if chunk.get("done"):
-                                break
-                        except json.JSONDecodeError:
-                            continue
+            async with get_client().stream(
+                "POST", f"{self._base_url}/api/chat", json=payload, timeout=120.0
+            ) as resp:
+                resp.raise_for_status()
+                async for line in iter_lines(resp):
+                    if not line.strip():
+                        continue
+                    try:
+                        chunk = orjson.loads(line)
+                        content = chunk.get("message", {}).get("content")
+                        if content:
+                            yield content
+                        if chunk.get("done"):
+                            break
+                    except orjson.JSONDecodeError:
+                        continue
         except httpx.ConnectError as exc:
+            self._available_cache = None
             raise ProviderError(
                 f"Cannot connect to Ollama at {self._base_url}. Is it running?"
             ) from exc
@@ -2,33 +2,46 @@
 
 from __future__ import annotations
 
-import json
-import os
 from collections.abc import AsyncGenerator
 
 import httpx
+import orjson
 
 from jarvis.ai.providers.base import BaseProvider, ProviderError
+from jarvis.ai.providers.env import provider_env
+from jarvis.ai.providers.http_client import get_client, iter_lines
 
 _API_URL = "https://openrouter.ai/api/v1/chat/completions"
+_WARMUP_URL = "https://openrouter.ai/api/v1/models"
 
 
 class OpenRouterProvider(BaseProvider):
     """AI provider backed by the OpenRouter API (Claude, GPT, Gemini, free models)."""
 
     def __init__(self, api_key: str | None = None) -> None:
-        self._api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
+        self._api_key = api_key or provider_env().openrouter_api_key
+        self._headers: dict[str, str] | None = (
+            {
+                "Authorization": f"Bearer {self._api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": "https://github.com/AzimjonKamiljanov/Jarvis-x",
+                "X-Title": "JARVIS-X",
+            }
+            if self._api_key
+            else None
+        )
 
     def is_available(self) -> bool:
         return bool(self._api_key)
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/AzimjonKamiljanov/Jarvis-x",
-            "X-Title": "JARVIS-X",
-        }
+    async def warmup(self) -> None:
+        """Establish a pooled TLS connection to OpenRouter."""
+        if not self._api_key:
+            return
+        try:
+            await get_client().head(_WARMUP_URL, timeout=2.0)
+        except httpx.HTTPError:
+            pass
 
     async def generate(
         self,
@@ -46,11 +59,12 @@ class OpenRouterProvider(BaseProvider):
             "temperature": temperature,
         }
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                resp = await client.post(_API_URL, headers=self._headers(), json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                return data["choices"][0]["message"]["content"] or ""
+            resp = await get_client().post(
+                _API_URL, headers=self._headers, json=payload, timeout=60.0
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            return data["choices"][0]["message"]["content"] or ""
         except httpx.HTTPStatusError as exc:
             raise ProviderError(f"OpenRouter API error {exc.response.status_code}: {exc}") from exc
         except Exception as exc:
@@ -69,24 +83,23 @@ class OpenRouterProvider(BaseProvider):
             "stream": True,
         }
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                async with client.stream(
-                    "POST", _API_URL, headers=self._headers(), json=payload
-                ) as resp:
-                    resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if not line.startswith("data:"):
-                            continue
-                        raw = line.removeprefix("data:").strip()
-                        if raw == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(raw)
-                            delta = chunk["choices"][0]["delta"].get("content")
-                            if delta:
-                                yield delta
-                        except (json.JSONDecodeError, KeyError):
-                            continue
+            async with get_client().stream(
+                "POST", _API_URL, headers=self._headers, json=payload, timeout=60.0
+            ) as resp:
+                resp.raise_for_status()
+                async for line in iter_lines(resp):
+                    if not line.startswith(b"data:"):
+                        continue
+                    raw = line[5:].strip()
+                    if raw == b"[DONE]":
+                        break
+                    try:
+                        chunk = orjson.loads(raw)
+                        delta = chunk["choices"][0]["delta"].get("content")
+                        if delta:
+                            yield delta
+                    except (orjson.JSONDecodeError, KeyError):
+                        continue
         except httpx.HTTPStatusError as exc:
             raise ProviderError(
                 f"OpenRouter streaming error {exc.response.status_code}: {exc}"
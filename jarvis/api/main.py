@@ -2,52 +2,172 @@
 
 from __future__ import annotations
 
-import io
+import asyncio
+import contextlib
+import hashlib
+import os
 import tempfile
+import time
 import uuid
+from collections import deque
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
-from fastapi import FastAPI, File, HTTPException, UploadFile, WebSocket, WebSocketDisconnect
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+import orjson
+from fastapi import (
+    FastAPI,
+    File,
+    HTTPException,
+    Request,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.background import BackgroundTask
 
+from jarvis.api.middleware import CORSHeadersASGI
 from jarvis.core.orchestrator import JarvisOrchestrator
+from jarvis.voice.audio_stream import AudioStream
+from jarvis.voice.stt_engine import STTEngine
+from jarvis.voice.tts_engine import TTSEngine
+
+try:
+    import psutil  # type: ignore[import]
+except ImportError:
+    psutil = None  # type: ignore[assignment]
+
+_uuid7 = getattr(uuid, "uuid7", None)
 
 _orchestrator: JarvisOrchestrator | None = None
 
 
+@dataclass(slots=True)
+class _VoiceEngines:
+    """Voice components shared by all requests; their models load lazily on first use."""
+
+    stt: STTEngine
+    tts: TTSEngine
+    mic: AudioStream
+
+
+_voice: _VoiceEngines | None = None
+
+# Worker threads for blocking calls (STT/TTS, file I/O) dispatched with asyncio.to_thread
+_EXECUTOR_WORKERS = min(64, (os.cpu_count() or 1) * 4)
+
+_CPU_SAMPLE_INTERVAL = 1.0  # seconds between background CPU samples
+_cpu_percent: float = 0.0
+
+
+async def _cpu_sampler() -> None:
+    """Refresh ``_cpu_percent`` periodically without blocking the event loop."""
+    global _cpu_percent
+    while True:
+        _cpu_percent = psutil.cpu_percent(interval=None)
+        await asyncio.sleep(_CPU_SAMPLE_INTERVAL)
+
+
 @asynccontextmanager
 async def _lifespan(app: FastAPI):  # noqa: ANN001
-    global _orchestrator
+    global _orchestrator, _voice
+    executor = ThreadPoolExecutor(max_workers=_EXECUTOR_WORKERS, thread_name_prefix="jarvis-io")
+    asyncio.get_running_loop().set_default_executor(executor)
     _orchestrator = JarvisOrchestrator()
     await _orchestrator.initialize()
+    _voice = _VoiceEngines(stt=STTEngine(), tts=TTSEngine(), mic=AudioStream())
+    sampler: asyncio.Task[None] | None = None
+    if psutil is not None:
+        psutil.cpu_percent(interval=None)  # prime the counter; the first reading is meaningless
+        sampler = asyncio.create_task(_cpu_sampler())
     yield
+    if sampler is not None:
+        sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampler
+    await _orchestrator.shutdown()
+    await asyncio.to_thread(_voice.tts.shutdown)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
 
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
 
-app = FastAPI(title="JARVIS-X API", version="0.1.0", lifespan=_lifespan)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+app = FastAPI(
+    title="JARVIS-X API",
+    version="0.1.0",
+    lifespan=_lifespan,
+    default_response_class=OrjsonResponse,
 )
 
+app.add_middleware(CORSHeadersASGI)
+
 
 def _get_orchestrator() -> JarvisOrchestrator:
     assert _orchestrator is not None, "Orchestrator not initialized"
     return _orchestrator
 
 
+def _get_voice() -> _VoiceEngines:
+    assert _voice is not None, "Voice engines not initialized"
+    return _voice
+
+
+_SESSION_ID_BATCH = 64
+_session_id_pool: deque[str] = deque()
+
+
+def _new_session_id() -> str:
+    """Return a fresh random session ID.
+
+    Uses ``uuid.uuid7()`` where available (Python 3.14+). Otherwise version-4 UUIDs
+    are generated in batches from a single ``os.urandom`` read.
+    """
+    if _uuid7 is not None:
+        return str(_uuid7())
+    if not _session_id_pool:
+        entropy = os.urandom(16 * _SESSION_ID_BATCH)
+        _session_id_pool.extend(
+            str(uuid.UUID(bytes=entropy[i : i + 16], version=4))
+            for i in range(0, len(entropy), 16)
+        )
+    return _session_id_pool.popleft()
+
+
+async def _ws_send(websocket: WebSocket, payload: dict) -> None:
+    """Send *payload* as a JSON text frame, encoded with orjson."""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+async def _ws_receive(websocket: WebSocket) -> Any:
+    """Receive one text or binary frame and decode it with orjson.
+
+    Raises:
+        WebSocketDisconnect: If the client closed the connection.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    raw = message.get("bytes")
+    return orjson.loads(raw if raw is not None else message.get("text", ""))
+
+
 # ---------------------------------------------------------------------------
 # Pydantic models
 # ---------------------------------------------------------------------------
 
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str
     session_id: str | None = None
     force_offline: bool = False
@@ -66,90 +186,151 @@ class ChatResponse(BaseModel):
 
 
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest) -> ChatResponse:
+async def chat(req: ChatRequest) -> OrjsonResponse:
     orchestrator = _get_orchestrator()
-    session_id = req.session_id or str(uuid.uuid4())
+    session_id = req.session_id or _new_session_id()
+    orchestrator.get_pooled_session(session_id)
     result = await orchestrator.process_message(
         user_input=req.message,
         session_id=session_id,
         force_offline=req.force_offline,
     )
-    return ChatResponse(
-        response=result["response"],
-        session_id=session_id,
-        model_used=result["model_used"],
-        response_time=result["response_time"],
+    # Returned directly so FastAPI skips response-model validation; ChatResponse
+    # still documents the shape in the OpenAPI schema.
+    return OrjsonResponse(
+        {
+            "response": result["response"],
+            "session_id": session_id,
+            "model_used": result["model_used"],
+            "response_time": result["response_time"],
+        }
     )
 
 
+# SSE batching: up to ~4 KB per frame, flushed once a frame is 20 ms old
+_SSE_FRAME_CHARS = 4096
+_SSE_FRAME_DELAY = 0.02
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+def _sse_frame(text: str) -> bytes:
+    """Encode *text* as one SSE event; embedded newlines become extra ``data:`` lines."""
+    data = text.encode()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return b"".join((_SSE_PREFIX, data.replace(b"\n", b"\ndata: "), _SSE_SUFFIX))
+
+
 @app.get("/api/chat/stream")
 async def chat_stream(
     message: str,
     session_id: str | None = None,
 ) -> StreamingResponse:
     orchestrator = _get_orchestrator()
-    sid = session_id or str(uuid.uuid4())
-
-    async def _event_generator() -> Any:
-        async for chunk in orchestrator.process_stream(
-            user_input=message, session_id=sid
+    sid = session_id or _new_session_id()
+
+    async def _event_generator() -> AsyncGenerator[bytes, None]:
+        orchestrator.get_pooled_session(sid)
+        async for batch in orchestrator.process_stream(
+            user_input=message,
+            session_id=sid,
+            max_chars=_SSE_FRAME_CHARS,
+            max_delay=_SSE_FRAME_DELAY,
         ):
-            yield f"data: {chunk}\n\n"
-        yield "data: [DONE]\n\n"
+            yield _sse_frame(batch)
+        yield _SSE_DONE
+
+    return StreamingResponse(
+        _event_generator(),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
 
-    return StreamingResponse(_event_generator(), media_type="text/event-stream")
+
+_HEALTH_TTL = 1.0  # seconds a rendered health body is reused
+_health_cache: tuple[float, bytes, str] | None = None  # (rendered_at, body, etag)
 
 
 @app.get("/api/health")
-async def health() -> dict:
-    orchestrator = _get_orchestrator()
-    providers = orchestrator.get_available_providers()
-    memory_entries = orchestrator.get_memory_count()
-    return {
-        "status": "operational",
-        "providers": providers,
-        "memory_entries": memory_entries,
-    }
+async def health(request: Request) -> Response:
+    global _health_cache
+    now = time.monotonic()
+    cached = _health_cache
+    if cached is None or now - cached[0] >= _HEALTH_TTL:
+        orchestrator = _get_orchestrator()
+        providers = await orchestrator.get_available_providers()
+        memory_entries = await orchestrator.get_memory_count_async()
+        body = orjson.dumps(
+            {
+                "status": "operational",
+                "providers": providers,
+                "memory_entries": memory_entries,
+            }
+        )
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = _health_cache = (now, body, etag)
+
+    _, body, etag = cached
+    headers = {"Cache-Control": f"max-age={int(_HEALTH_TTL)}", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/system/stats")
 async def system_stats() -> dict:
-    try:
-        import psutil  # type: ignore[import]
-
-        return {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-            "ram_percent": psutil.virtual_memory().percent,
-            "disk_percent": psutil.disk_usage("/").percent,
-        }
-    except ImportError:
+    if psutil is None:
         return {"error": "psutil not installed"}
+    return {
+        "cpu_percent": _cpu_percent,
+        "ram_percent": psutil.virtual_memory().percent,
+        "disk_percent": psutil.disk_usage("/").percent,
+    }
 
 
 @app.websocket("/ws/chat")
 async def ws_chat(websocket: WebSocket) -> None:
     await websocket.accept()
     orchestrator = _get_orchestrator()
-    session_id = str(uuid.uuid4())
+    session_id: str | None = None
     try:
         while True:
-            data = await websocket.receive_json()
+            data = await _ws_receive(websocket)
+            if session_id is None:
+                # A returning client may resume its pooled session
+                requested = data.get("session_id")
+                if requested is not None and (
+                    not isinstance(requested, str) or not requested.strip()
+                ):
+                    await _ws_send(
+                        websocket,
+                        {"type": "error", "content": "session_id must be a non-empty string."},
+                    )
+                    continue
+                session_id = requested or _new_session_id()
+                await _ws_send(websocket, {"type": "session", "session_id": session_id})
+            # Any frame counts as activity, so an open socket is not evicted as idle
+            orchestrator.get_pooled_session(session_id)
             message = data.get("message", "")
+            if not isinstance(message, str) or not message or message.isspace():
+                await _ws_send(websocket, {"type": "error", "content": "Message is empty."})
+                continue
             stream = data.get("stream", False)
 
             if stream:
                 async for chunk in orchestrator.process_stream(
                     user_input=message, session_id=session_id
                 ):
-                    await websocket.send_json({"type": "chunk", "content": chunk})
-                await websocket.send_json({"type": "done", "content": ""})
+                    await _ws_send(websocket, {"type": "chunk", "content": chunk})
+                await _ws_send(websocket, {"type": "done", "content": ""})
             else:
                 result = await orchestrator.process_message(
                     user_input=message, session_id=session_id
                 )
-                await websocket.send_json(
-                    {"type": "response", "content": result["response"]}
-                )
+                await _ws_send(websocket, {"type": "response", "content": result["response"]})
     except WebSocketDisconnect:
         pass
 
@@ -177,45 +358,57 @@ class VoiceChatResponse(BaseModel):
     audio_url: str | None = None
 
 
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+# Keep voice temp files on RAM-backed tmpfs when available; None means the system default
+_TMPDIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+async def _save_upload(file: UploadFile) -> str:
+    """Copy an uploaded file into a temporary .wav file in fixed-size chunks.
+
+    Returns:
+        Path of the temporary file; the caller is responsible for deleting it.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=_TMPDIR) as tmp:
+        try:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                tmp.write(chunk)
+        except BaseException:
+            # A failed or cancelled copy must not leave a file behind on RAM-backed tmpfs
+            with contextlib.suppress(OSError):
+                os.unlink(tmp.name)
+            raise
+        return tmp.name
+
+
 @app.get("/api/voice/status", response_model=VoiceStatusResponse)
 async def voice_status() -> VoiceStatusResponse:
     """Return the availability status of voice components."""
-    from jarvis.voice.audio_stream import AudioStream
-    from jarvis.voice.stt_engine import STTEngine
-    from jarvis.voice.tts_engine import TTSEngine
-
+    voice = _get_voice()
     return VoiceStatusResponse(
-        stt=STTEngine().is_available(),
-        tts=TTSEngine().is_available(),
-        microphone=AudioStream().is_available(),
+        stt=voice.stt.is_available(),
+        tts=voice.tts.is_available(),
+        microphone=voice.mic.is_available(),
     )
 
 
 @app.post("/api/voice/transcribe", response_model=TranscribeResponse)
 async def voice_transcribe(file: UploadFile = File(...)) -> TranscribeResponse:
     """Transcribe an uploaded WAV file to text using STT."""
-    import os
-
-    from jarvis.voice.stt_engine import STTEngine
-
-    stt = STTEngine()
+    stt = _get_voice().stt
     if not stt.is_available():
         raise HTTPException(
             status_code=503,
             detail="STT is not available. Install voice dependencies and download the Vosk model.",
         )
 
-    audio_bytes = await file.read()
-
     # Write to a temp file so STTEngine can use wave module
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = tmp.name
+    tmp_path = await _save_upload(file)
 
     try:
-        result = stt.transcribe_file(tmp_path)
+        result = await asyncio.to_thread(stt.transcribe_file, tmp_path)
     finally:
-        os.unlink(tmp_path)
+        await asyncio.to_thread(os.unlink, tmp_path)
 
     return TranscribeResponse(
         text=str(result.get("text", "")),
@@ -224,59 +417,49 @@ async def voice_transcribe(file: UploadFile = File(...)) -> TranscribeResponse:
 
 
 @app.post("/api/voice/speak")
-async def voice_speak(text: str) -> StreamingResponse:
+async def voice_speak(text: str) -> FileResponse:
     """Convert text to speech and return the WAV audio file."""
-    import os
-
-    from jarvis.voice.tts_engine import TTSEngine
-
-    tts = TTSEngine()
+    tts = _get_voice().tts
     if not tts.is_available():
         raise HTTPException(
             status_code=503,
             detail="TTS is not available. Install voice dependencies.",
         )
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=_TMPDIR) as tmp:
         tmp_path = tmp.name
 
     try:
-        tts.save_to_file(text, tmp_path)
-        with open(tmp_path, "rb") as f:
-            audio_bytes = f.read()
-    finally:
-        os.unlink(tmp_path)
-
-    return StreamingResponse(
-        io.BytesIO(audio_bytes),
+        await asyncio.to_thread(tts.save_to_file, text, tmp_path)
+    except BaseException:
+        await asyncio.to_thread(os.unlink, tmp_path)
+        raise
+
+    # The file is sent straight from disk and removed once the response is done
+    return FileResponse(
+        tmp_path,
         media_type="audio/wav",
-        headers={"Content-Disposition": "attachment; filename=speech.wav"},
+        filename="speech.wav",
+        background=BackgroundTask(os.unlink, tmp_path),
     )
 
 
 @app.post("/api/voice/chat", response_model=VoiceChatResponse)
 async def voice_chat(file: UploadFile = File(...)) -> VoiceChatResponse:
     """Transcribe uploaded audio, get AI response, and return text (+ spoken audio URL)."""
-    import os
-
-    from jarvis.voice.stt_engine import STTEngine
-
-    stt = STTEngine()
+    stt = _get_voice().stt
     if not stt.is_available():
         raise HTTPException(
             status_code=503,
             detail="STT is not available. Install voice dependencies and download the Vosk model.",
         )
 
-    audio_bytes = await file.read()
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = tmp.name
+    tmp_path = await _save_upload(file)
 
     try:
-        stt_result = stt.transcribe_file(tmp_path)
+        stt_result = await asyncio.to_thread(stt.transcribe_file, tmp_path)
     finally:
-        os.unlink(tmp_path)
+        await asyncio.to_thread(os.unlink, tmp_path)
 
     user_text = str(stt_result.get("text", "")).strip()
 
@@ -284,7 +467,8 @@ async def voice_chat(file: UploadFile = File(...)) -> VoiceChatResponse:
         raise HTTPException(status_code=400, detail="Could not transcribe any speech from audio.")
 
     orchestrator = _get_orchestrator()
-    session_id = str(uuid.uuid4())
+    session_id = _new_session_id()
+    orchestrator.get_pooled_session(session_id)
     ai_result = await orchestrator.process_message(
         user_input=user_text,
         session_id=session_id,
@@ -0,0 +1,66 @@
+"""Lightweight ASGI middleware for the JARVIS-X API."""
+
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class CORSHeadersASGI:
+    """Permissive CORS implemented directly on the ASGI interface.
+
+    Every origin is allowed. The request's ``Origin`` is echoed back together with
+    ``Access-Control-Allow-Credentials`` so credentialed browser requests work.
+    Preflight requests are answered here without reaching the application, and
+    non-HTTP scopes (WebSocket, lifespan) pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: bytes | None = None
+        preflight_method: bytes | None = None
+        preflight_headers: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                preflight_method = value
+            elif name == b"access-control-request-headers":
+                preflight_headers = value
+
+        if origin is None:
+            # Not a cross-origin request
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS" and preflight_method is not None:
+            headers = cors_headers + [
+                (b"access-control-allow-methods", _ALLOW_METHODS),
+                (b"access-control-max-age", b"600"),
+                (b"content-length", b"0"),
+            ]
+            if preflight_headers:
+                headers.append((b"access-control-allow-headers", preflight_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -4,13 +4,26 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass
+_DEFAULT_MODEL_PREFERENCES: dict[str, str] = {
+    "trivial": "llama-3.1-8b-instant",
+    "simple": "llama-3.1-8b-instant",
+    "moderate": "llama-3.3-70b-versatile",
+    "complex": "llama-3.3-70b-versatile",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ProviderModelConfig:
     name: str
     latency_ms: int
@@ -18,39 +31,38 @@ class ProviderModelConfig:
     offline_capable: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroqProviderConfig:
     api_endpoint: str = "https://api.groq.com/openai/v1"
     models: list[ProviderModelConfig] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AIConfig:
     default_provider: str = "groq"
     temperature: float = 0.7
     max_tokens: int = 2048
     model_preferences: dict[str, str] = field(
-        default_factory=lambda: {
-            "trivial": "llama-3.1-8b-instant",
-            "simple": "llama-3.1-8b-instant",
-            "moderate": "llama-3.3-70b-versatile",
-            "complex": "llama-3.3-70b-versatile",
-        }
+        default_factory=_DEFAULT_MODEL_PREFERENCES.copy
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MemoryConfig:
     short_term_limit: int = 20
+    session_pool_size: int = 1024
+    session_idle_seconds: float = 1800.0
+    vector_db_path: str = "./data/chromadb"
+    vector_db_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemConfig:
     language: str = "uz"
     debug: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JarvisConfig:
     ai: AIConfig = field(default_factory=AIConfig)
     memory: MemoryConfig = field(default_factory=MemoryConfig)
@@ -58,38 +70,41 @@ class JarvisConfig:
     groq: GroqProviderConfig = field(default_factory=GroqProviderConfig)
 
 
+@cache
 def load_config(path: str | None = None) -> JarvisConfig:
-    """Load configuration from a YAML file and .env, returning a JarvisConfig."""
+    """Load configuration from a YAML file and .env, returning a JarvisConfig.
+
+    Results are cached per *path*; call ``load_config.cache_clear()`` to force a
+    reload after the file or environment changes.
+    """
     load_dotenv()
 
     raw: dict = {}
     if path and Path(path).exists():
         with open(path) as fh:
-            raw = yaml.safe_load(fh) or {}
+            raw = yaml.load(fh, Loader=_YamlLoader) or {}
     else:
         default_path = Path(__file__).parent.parent.parent / "config" / "jarvis_config.yaml"
         if default_path.exists():
             with open(default_path) as fh:
-                raw = yaml.safe_load(fh) or {}
+                raw = yaml.load(fh, Loader=_YamlLoader) or {}
 
     ai_raw = raw.get("ai", {})
     ai_config = AIConfig(
         default_provider=ai_raw.get("default_provider", "groq"),
         temperature=float(ai_raw.get("temperature", 0.7)),
         max_tokens=int(ai_raw.get("max_tokens", 2048)),
-        model_preferences=ai_raw.get(
-            "model_preferences",
-            {
-                "trivial": "llama-3.1-8b-instant",
-                "simple": "llama-3.1-8b-instant",
-                "moderate": "llama-3.3-70b-versatile",
-                "complex": "llama-3.3-70b-versatile",
-            },
-        ),
+        model_preferences=ai_raw.get("model_preferences", dict(_DEFAULT_MODEL_PREFERENCES)),
     )
 
     mem_raw = raw.get("memory", {})
-    memory_config = MemoryConfig(short_term_limit=int(mem_raw.get("short_term_limit", 20)))
+    memory_config = MemoryConfig(
+        short_term_limit=int(mem_raw.get("short_term_limit", 20)),
+        session_pool_size=int(mem_raw.get("session_pool_size", 1024)),
+        session_idle_seconds=float(mem_raw.get("session_idle_seconds", 1800.0)),
+        vector_db_path=str(mem_raw.get("vector_db_path", "./data/chromadb")),
+        vector_db_url=mem_raw.get("vector_db_url") or None,
+    )
 
     sys_raw = raw.get("system", {})
     system_config = SystemConfig(
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
 
 from jarvis.ai.model_router import ModelRouter
-from jarvis.ai.providers.base import BaseProvider, ProviderError
+from jarvis.ai.providers.base import BaseProvider, ProviderError, coalesce_stream
 from jarvis.ai.providers.groq_provider import GroqProvider
+from jarvis.ai.providers.http_client import aclose_client
 from jarvis.ai.providers.ollama_provider import OllamaProvider
 from jarvis.ai.providers.openrouter_provider import OpenRouterProvider
 from jarvis.core.config import JarvisConfig, load_config
@@ -20,6 +25,18 @@ _SYSTEM_PROMPT = (
     "You are helpful, concise, and precise. "
     "If asked who you are, introduce yourself as JARVIS-X, an AI assistant."
 )
+_PROVIDERS_TTL = 5.0  # seconds to reuse a get_available_providers() result
+
+# Shared by every request; providers only serialize messages, never mutate them.
+_SYSTEM_MESSAGE: dict[str, str] = {"role": "system", "content": _SYSTEM_PROMPT}
+
+
+@dataclass(slots=True)
+class SessionState:
+    """Per-session bookkeeping kept while a conversation is active."""
+
+    session_id: str
+    last_seen: float = field(default_factory=time.monotonic)
 
 
 class JarvisOrchestrator:
@@ -30,12 +47,20 @@ class JarvisOrchestrator:
         self._memory: MemoryManager | None = None
         self._router: ModelRouter | None = None
         self._providers: dict[str, BaseProvider] = {}
+        self._warmup_task: asyncio.Task[None] | None = None
+        self._providers_cache: tuple[float, list[str]] | None = None
+        self._session_pool: OrderedDict[str, SessionState] = OrderedDict()
+        self._pool_cleanup_task: asyncio.Task[None] | None = None
         self._initialized = False
 
     async def initialize(self) -> None:
         """Set up providers, router, and memory."""
-        self._memory = MemoryManager(
+        # Opening the vector store is blocking; keep it off the event loop
+        self._memory = await asyncio.to_thread(
+            MemoryManager,
             short_term_limit=self._config.memory.short_term_limit,
+            vector_db_path=self._config.memory.vector_db_path,
+            vector_db_url=self._config.memory.vector_db_url,
         )
         self._router = ModelRouter()
         self._providers = {
@@ -43,15 +68,92 @@ class JarvisOrchestrator:
             "openrouter": OpenRouterProvider(),
             "ollama": OllamaProvider(),
         }
+        self._providers_cache = None
+        # Handshakes happen in the background, off the first request's critical path
+        self._warmup_task = asyncio.create_task(self._warm_up_providers())
+        if self._pool_cleanup_task is None or self._pool_cleanup_task.done():
+            self._pool_cleanup_task = asyncio.create_task(self._pool_cleanup())
         self._initialized = True
 
+    async def _warm_up_providers(self) -> None:
+        await asyncio.gather(
+            *(p.warmup() for p in self._providers.values()), return_exceptions=True
+        )
+
+    async def shutdown(self) -> None:
+        """Drain pending memory writes and release shared resources such as pooled connections."""
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        if self._pool_cleanup_task is not None:
+            self._pool_cleanup_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._pool_cleanup_task
+            self._pool_cleanup_task = None
+        if self._memory is not None:
+            await asyncio.to_thread(self._memory.close)
+        await aclose_client()
+
+    def get_pooled_session(self, session_id: str) -> SessionState:
+        """Return the pooled state for *session_id*, creating it if needed.
+
+        The session is marked as most recently used. When the pool is full the
+        least recently used session is evicted and its short-term history dropped.
+        Only sessions registered here are ever evicted: the API pools its client
+        sessions, while CLI and voice sessions stay out of the pool.
+        """
+        state = self._session_pool.get(session_id)
+        if state is not None:
+            state.last_seen = time.monotonic()
+            self._session_pool.move_to_end(session_id)
+            return state
+        state = self._session_pool[session_id] = SessionState(session_id)
+        while len(self._session_pool) > self._config.memory.session_pool_size:
+            evicted, _ = self._session_pool.popitem(last=False)
+            self._forget_session(evicted)
+        return state
+
+    def evict_idle(self) -> int:
+        """Evict sessions idle longer than the configured limit; return how many were dropped."""
+        cutoff = time.monotonic() - self._config.memory.session_idle_seconds
+        evicted = 0
+        # The pool is ordered by recency, so stop at the first fresh session
+        while self._session_pool:
+            session_id, state = next(iter(self._session_pool.items()))
+            if state.last_seen >= cutoff:
+                break
+            del self._session_pool[session_id]
+            self._forget_session(session_id)
+            evicted += 1
+        return evicted
+
+    def _forget_session(self, session_id: str) -> None:
+        if self._memory is not None:
+            self._memory.clear_session(session_id)
+
+    async def _pool_cleanup(self) -> None:
+        interval = min(60.0, max(1.0, self._config.memory.session_idle_seconds / 2))
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
     def set_router(self, router: ModelRouter) -> None:
         """Replace the model router (useful for testing or overriding model selection)."""
         self._router = router
 
-    def get_available_providers(self) -> list[str]:
-        """Return names of providers that are currently available."""
-        return [name for name, p in self._providers.items() if p.is_available()]
+    async def get_available_providers(self) -> list[str]:
+        """Return names of providers that are currently available.
+
+        The result is reused for a few seconds so hot chat paths do not re-probe
+        every provider per request; a provider error drops the cached value.
+        """
+        now = time.monotonic()
+        cached = self._providers_cache
+        if cached is not None and now - cached[0] < _PROVIDERS_TTL:
+            return list(cached[1])
+        flags = await asyncio.gather(*(p.is_available_async() for p in self._providers.values()))
+        names = [name for name, ok in zip(self._providers, flags) if ok]
+        self._providers_cache = (now, names)
+        return list(names)
 
     def get_memory_count(self) -> int:
         """Return number of entries in long-term memory (0 if unavailable)."""
@@ -59,33 +161,53 @@ class JarvisOrchestrator:
             return 0
         return self._memory.long.count()
 
+    async def get_memory_count_async(self) -> int:
+        """Async variant of :meth:`get_memory_count`; a Chroma server is queried off the loop."""
+        if self._memory is not None and self._memory.remote:
+            return await asyncio.to_thread(self.get_memory_count)
+        return self.get_memory_count()
+
+    async def _build_context(self, session_id: str, user_input: str) -> list[dict]:
+        """Build the memory context, running Chroma server lookups in a worker thread."""
+        assert self._memory is not None
+        if self._memory.remote:
+            return await asyncio.to_thread(self._memory.build_context, session_id, user_input)
+        return self._memory.build_context(session_id, user_input)
+
     async def process_message(
         self,
         user_input: str,
         session_id: str = "default",
         force_offline: bool = False,
+        normalized_input: str | None = None,
     ) -> dict:
         """Process a user message end-to-end.
 
-        Returns a dict with keys: response, model_used, response_time.
+        *normalized_input* may carry ``user_input.lower().strip()`` if the caller
+        already computed it, so routing does not redo the work.
+
+        Returns a dict with keys: response, model_used, response_time. Empty or
+        whitespace-only input returns an empty response without calling a model.
         """
+        if not user_input or user_input.isspace():
+            return {"response": "", "model_used": "none", "response_time": 0.0}
         if not self._initialized:
             await self.initialize()
 
         assert self._memory is not None
         assert self._router is not None
-
         # 1. Build context (short-term + relevant long-term memories)
-        context = self._memory.build_context(session_id, user_input)
-        messages = [{"role": "system", "content": _SYSTEM_PROMPT}] + context
+        context = await self._build_context(session_id, user_input)
+        messages = [_SYSTEM_MESSAGE, *context]
 
         # 2. Select model considering available providers
-        available = self.get_available_providers()
+        available = await self.get_available_providers()
         try:
             model_cfg = self._router.select_model(
                 user_input,
                 force_offline=force_offline,
                 available_providers=available or None,
+                normalized=normalized_input,
             )
         except RuntimeError as exc:
             self._memory.add(session_id, "assistant", str(exc))
@@ -115,18 +237,25 @@ class JarvisOrchestrator:
         user_input: str,
         session_id: str = "default",
         force_offline: bool = False,
+        max_chars: int = 64,
+        max_delay: float = 0.01,
     ) -> AsyncGenerator[str, None]:
-        """Stream a response chunk by chunk."""
+        """Stream a response chunk by chunk; empty input yields nothing.
+
+        Provider chunks are merged by :func:`coalesce_stream` using *max_chars*
+        and *max_delay*.
+        """
+        if not user_input or user_input.isspace():
+            return
         if not self._initialized:
             await self.initialize()
 
         assert self._memory is not None
         assert self._router is not None
+        context = await self._build_context(session_id, user_input)
+        messages = [_SYSTEM_MESSAGE, *context]
 
-        context = self._memory.build_context(session_id, user_input)
-        messages = [{"role": "system", "content": _SYSTEM_PROMPT}] + context
-
-        available = self.get_available_providers()
+        available = await self.get_available_providers()
         try:
             model_cfg = self._router.select_model(
                 user_input,
@@ -138,18 +267,21 @@ class JarvisOrchestrator:
             return
 
         provider = self._providers.get(model_cfg.provider)
-        if provider is None or not provider.is_available():
+        if provider is None or not await provider.is_available_async():
             yield "I'm currently unavailable. Please check your API key or internet connection."
             return
 
         full_response: list[str] = []
         try:
-            async for chunk in provider.generate_stream(
-                messages=messages, model=model_cfg.name
+            async for chunk in coalesce_stream(
+                provider.generate_stream(messages=messages, model=model_cfg.name),
+                max_chars=max_chars,
+                max_delay=max_delay,
             ):
                 full_response.append(chunk)
                 yield chunk
         except ProviderError as exc:
+            self._providers_cache = None
             yield str(exc)
             return
 
@@ -166,7 +298,7 @@ class JarvisOrchestrator:
         assert self._router is not None
 
         provider = self._providers.get(model_cfg_provider)
-        if provider and provider.is_available():
+        if provider and await provider.is_available_async():
             try:
                 return await provider.generate(
                     messages=messages,
@@ -175,15 +307,13 @@ class JarvisOrchestrator:
                     temperature=self._config.ai.temperature,
                 )
             except ProviderError:
-                pass
+                self._providers_cache = None
 
         # Try fallback models from other available providers
-        fallbacks = self._router.get_models_except(model_cfg_name)
-        for fallback in sorted(fallbacks, key=lambda m: m.latency_ms):
-            if force_offline and not fallback.offline_capable:
-                continue
+        fallbacks = self._router.get_models_except(model_cfg_name, offline_only=force_offline)
+        for fallback in fallbacks:
             fb_provider = self._providers.get(fallback.provider)
-            if fb_provider and fb_provider.is_available():
+            if fb_provider and await fb_provider.is_available_async():
                 try:
                     return await fb_provider.generate(
                         messages=messages,
@@ -2,54 +2,254 @@
 
 from __future__ import annotations
 
-import uuid
+import atexit
+import hashlib
+import itertools
+import secrets
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
+from urllib.parse import urlsplit
+
+_BATCH_SIZE = 128  # pending writes that trigger a flush
+_BATCH_MAX_AGE = 5.0  # seconds a write may stay buffered before it is flushed
+_QUERY_CACHE_SIZE = 256  # recent search results kept until the next write lands
+_RECENT_HASHES = 4096  # content hashes remembered to skip storing duplicate text
+_SERVER_CACHE_TTL = 2.0  # seconds a cached count or result is trusted when others may write
+
+# HNSW build parameters applied when the collection is first created
+_COLLECTION_METADATA = {"hnsw:construction_ef": 100, "hnsw:M": 16}
+# WAL keeps commits durable while avoiding a full journal rewrite per transaction.
+# Only file-level settings belong here: Chroma pools one connection per thread, so
+# per-connection PRAGMAs (synchronous, temp_store) would miss the writer thread.
+_SQLITE_PRAGMAS = ("PRAGMA journal_mode=WAL",)
+
+
+# Stores that have buffered rows, flushed once at interpreter exit; weak so dropped
+# stores are not kept alive
+_open_stores: weakref.WeakSet[LongTermMemory] = weakref.WeakSet()
+
+
+def _flush_open_stores() -> None:
+    for store in list(_open_stores):
+        try:
+            store.flush()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_open_stores)
+
+
+def _digest(text: str) -> bytes:
+    """Key used to recognize recently stored duplicate text."""
+    return hashlib.sha256(text.encode()).digest()[:16]
 
 
 class LongTermMemory:
-    """Persistent semantic memory backed by ChromaDB."""
+    """Persistent semantic memory backed by ChromaDB.
 
-    def __init__(self, persist_dir: str = "./data/chromadb") -> None:
+    Uses an embedded on-disk store by default, or a Chroma server when
+    *server_url* (e.g. ``http://localhost:8001``) is given, which keeps the index
+    and its memory out of this process.
+    """
+
+    def __init__(
+        self, persist_dir: str = "./data/chromadb", server_url: str | None = None
+    ) -> None:
         self._persist_dir = persist_dir
+        self._server_url = server_url
         self._client = None
         self._collection = None
         self._available = False
+        # Buffered (id, text, metadata) rows, written to ChromaDB in batches
+        self._pending: list[tuple[str, str, dict]] = []
+        self._pending_since = 0.0
+        self._lock = threading.Lock()  # guards buffers, caches and counters
+        self._write_lock = threading.Lock()  # serializes batch inserts into the collection
+        # (normalized query, n_results) -> (expires_at, results); cleared whenever new
+        # rows are written
+        self._query_cache: OrderedDict[tuple[str, int], tuple[float, list[dict]]] = (
+            OrderedDict()
+        )
+        self._write_epoch = 0
+        self._recent_hashes: OrderedDict[bytes, None] = OrderedDict()
+        # Document IDs: a random per-instance prefix plus a counter, unique without uuid4()
+        self._id_prefix = secrets.token_hex(8)
+        self._id_counter = itertools.count()
+        # Rows in the collection, tracked locally so searches skip a COUNT(*) round trip
+        self._count_cache: int | None = None
+        # A shared server also takes writes from other processes, so cached counts and
+        # search results expire
+        self._cache_ttl = _SERVER_CACHE_TTL if server_url else float("inf")
+        self._count_expires = 0.0
         self._init_chromadb()
 
     def _init_chromadb(self) -> None:
         try:
             import chromadb  # type: ignore[import]
 
-            Path(self._persist_dir).mkdir(parents=True, exist_ok=True)
-            self._client = chromadb.PersistentClient(path=self._persist_dir)
-            self._collection = self._client.get_or_create_collection("jarvis_memory")
+            if self._server_url:
+                url = urlsplit(self._server_url)
+                ssl = url.scheme == "https"
+                self._client = chromadb.HttpClient(
+                    host=url.hostname or "localhost",
+                    port=url.port or (443 if ssl else 8000),
+                    ssl=ssl,
+                )
+            else:
+                Path(self._persist_dir).mkdir(parents=True, exist_ok=True)
+                self._client = chromadb.PersistentClient(path=self._persist_dir)
+            self._collection = self._client.get_or_create_collection(
+                "jarvis_memory", metadata=_COLLECTION_METADATA
+            )
+            if not self._server_url:
+                self._tune_sqlite()
             self._available = True
         except ImportError:
             self._available = False
         except Exception:
             self._available = False
 
+    def _tune_sqlite(self) -> None:
+        """Switch Chroma's SQLite store to WAL journaling (best effort).
+
+        This reaches into Chroma internals, which differ between versions; any
+        failure leaves the database on its default settings.
+        """
+        try:
+            from chromadb.db.impl.sqlite import SqliteDB  # type: ignore[import]
+
+            db = self._client._system.instance(SqliteDB)  # type: ignore[union-attr]
+            conn = db._conn_pool.connect()
+            for pragma in _SQLITE_PRAGMAS:
+                conn.execute(pragma)
+        except Exception:
+            pass
+
     @property
     def available(self) -> bool:
         return self._available
 
+    @property
+    def flush_interval(self) -> float:
+        """Seconds a buffered write may wait before it should be flushed."""
+        return _BATCH_MAX_AGE
+
+    @property
+    def remote(self) -> bool:
+        """True when backed by a Chroma server, so searches and counts are HTTP calls."""
+        return self._server_url is not None
+
     def store(self, text: str, metadata: dict | None = None) -> None:
-        """Store text with an auto-generated ID."""
+        """Queue text for storage with an auto-generated ID.
+
+        Text identical to one of the last ``_RECENT_HASHES`` stored entries is
+        skipped. Writes are buffered and sent to ChromaDB in batches of up to
+        ``_BATCH_SIZE`` rows, or once the oldest buffered row is ``_BATCH_MAX_AGE``
+        seconds old. Call :meth:`flush` to write pending rows immediately.
+        """
         if not self._available or self._collection is None:
             return
-        doc_id = str(uuid.uuid4())
-        self._collection.add(
-            documents=[text],
-            ids=[doc_id],
-            metadatas=[metadata or {}],
-        )
+        digest = _digest(text)
+        with self._lock:
+            if digest in self._recent_hashes:
+                self._recent_hashes.move_to_end(digest)
+                return
+            self._recent_hashes[digest] = None
+            if len(self._recent_hashes) > _RECENT_HASHES:
+                self._recent_hashes.popitem(last=False)
+            if not self._pending:
+                self._pending_since = time.monotonic()
+                _open_stores.add(self)
+            doc_id = f"{self._id_prefix}{next(self._id_counter):012x}"
+            self._pending.append((doc_id, text, metadata or {}))
+            full = len(self._pending) >= _BATCH_SIZE or self._is_stale()
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered entries to ChromaDB.
+
+        The buffer is swapped out under the state lock and written outside it, so
+        searches are never held up by the embedding and insert of a batch.
+        """
+        if self._collection is None:
+            return
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if not batch:
+                    return
+                # Bumped at start and end so a count read while a batch is in flight
+                # is never cached
+                self._write_epoch += 1
+            ids, documents, metadatas = zip(*batch)
+            try:
+                self._collection.add(
+                    documents=list(documents),
+                    ids=list(ids),
+                    metadatas=list(metadatas),
+                )
+            except Exception:
+                with self._lock:
+                    self._count_cache = None  # unknown how many rows landed
+                    self._write_epoch += 1
+                    # Let the dropped texts be stored again instead of deduplicated away
+                    for text in documents:
+                        self._recent_hashes.pop(_digest(text), None)
+                raise
+            with self._lock:
+                if self._count_cache is not None:
+                    self._count_cache += len(ids)
+                self._query_cache.clear()
+                self._write_epoch += 1
+
+    def _stored_count(self) -> int:
+        """Return the number of rows in the collection, querying it only when unknown.
+
+        In server mode the cached count is re-read after ``_SERVER_CACHE_TTL``
+        seconds, so rows written by other clients become searchable.
+        """
+        count = self._count_cache
+        if count is None or time.monotonic() >= self._count_expires:
+            assert self._collection is not None
+            with self._lock:
+                epoch = self._write_epoch
+            count = self._collection.count()
+            with self._lock:
+                # A batch written meanwhile may or may not be included in *count*
+                if epoch == self._write_epoch:
+                    self._count_cache = count
+                    self._count_expires = time.monotonic() + self._cache_ttl
+        return count
+
+    def _is_stale(self) -> bool:
+        return bool(self._pending) and time.monotonic() - self._pending_since >= _BATCH_MAX_AGE
 
     def search(self, query: str, n_results: int = 5) -> list[dict]:
-        """Semantic search; returns list of {text, distance, metadata}."""
+        """Semantic search; returns list of {text, distance, metadata}.
+
+        Results for a repeated query (case- and whitespace-insensitive) are served
+        from an LRU cache until the next batch of writes reaches the collection, or
+        in server mode for at most ``_SERVER_CACHE_TTL`` seconds.
+        """
         if not self._available or self._collection is None:
             return []
         try:
-            count = self._collection.count()
+            key = (query.strip().lower(), n_results)
+            with self._lock:
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    expires_at, hits = cached
+                    if time.monotonic() < expires_at:
+                        self._query_cache.move_to_end(key)
+                        return list(hits)
+                    del self._query_cache[key]
+                epoch = self._write_epoch
+            count = self._stored_count()
             if count == 0:
                 return []
             results = self._collection.query(
@@ -62,15 +262,23 @@ class LongTermMemory:
             metadatas = results.get("metadatas", [[]])[0]
             for doc, dist, meta in zip(docs, distances, metadatas):
                 output.append({"text": doc, "distance": dist, "metadata": meta})
-            return output
+            with self._lock:
+                # Skip caching if a flush landed while the query was running
+                if epoch == self._write_epoch:
+                    self._query_cache[key] = (time.monotonic() + self._cache_ttl, output)
+                    if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                        self._query_cache.popitem(last=False)
+            return list(output)
         except Exception:
+            with self._lock:
+                self._count_cache = None  # re-read the count on the next call
             return []
 
     def count(self) -> int:
-        """Return number of stored entries."""
+        """Return number of stored entries, including writes not yet flushed."""
         if not self._available or self._collection is None:
             return 0
         try:
-            return self._collection.count()
+            return self._stored_count() + len(self._pending)
         except Exception:
             return 0
@@ -2,9 +2,38 @@
 
 from __future__ import annotations
 
+import atexit
+import queue
+import threading
+import weakref
+from functools import lru_cache
+
 from jarvis.memory.long_term import LongTermMemory
 from jarvis.memory.short_term import ShortTermMemory
 
+# Managers with a running writer, closed once at interpreter exit; weak so dropped
+# managers are not kept alive
+_open_managers: weakref.WeakSet[MemoryManager] = weakref.WeakSet()
+
+
+def _close_open_managers() -> None:
+    for manager in list(_open_managers):
+        try:
+            manager.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_open_managers)
+
+
+@lru_cache(maxsize=128)
+def _format_memories(texts: tuple[str, ...]) -> str:
+    """Render recalled memories as the body of the context system message."""
+    return "Relevant past interactions:\n" + "\n".join(
+        f"[Memory {i}]: {text}" for i, text in enumerate(texts, 1)
+    )
+
 
 class MemoryManager:
     """Unified memory interface that wraps short-term and long-term storage."""
@@ -13,17 +42,60 @@ class MemoryManager:
         self,
         short_term_limit: int = 20,
         vector_db_path: str = "./data/chromadb",
+        vector_db_url: str | None = None,
     ) -> None:
         self.short = ShortTermMemory(limit=short_term_limit)
         self.long: LongTermMemory | None = None
-        _lt = LongTermMemory(persist_dir=vector_db_path)
+        _lt = LongTermMemory(persist_dir=vector_db_path, server_url=vector_db_url)
         if _lt.available:
             self.long = _lt
 
+        # Long-term writes are handed to a single background writer so callers
+        # never wait on ChromaDB; ``None`` is the shutdown sentinel.
+        self._write_q: queue.Queue[tuple[str, dict] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        if self.long is not None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="jarvis-memory-writer", daemon=True
+            )
+            self._writer.start()
+            _open_managers.add(self)
+
+    @property
+    def remote(self) -> bool:
+        """True when long-term memory lives on a Chroma server (its calls block on HTTP)."""
+        return self.long is not None and self.long.remote
+
+    def _writer_loop(self) -> None:
+        assert self.long is not None
+        interval = self.long.flush_interval
+        while True:
+            try:
+                item = self._write_q.get(timeout=interval)
+            except queue.Empty:
+                # Idle: write out a partial batch so it never waits on the next turn
+                try:
+                    self.long.flush()
+                except Exception:
+                    pass
+                continue
+            try:
+                if item is None:
+                    return
+                self.long.store(*item)
+            except Exception:
+                pass  # a failed write must not kill the writer
+            finally:
+                self._write_q.task_done()
+
     def add(self, session_id: str, role: str, content: str) -> None:
         """Add a message to short-term memory."""
         self.short.add(session_id, role, content)
 
+    def clear_session(self, session_id: str) -> None:
+        """Drop the short-term history of *session_id* (long-term memory is kept)."""
+        self.short.clear(session_id)
+
     def get_context(self, session_id: str) -> list[dict]:
         """Return short-term context for the session."""
         return self.short.get_context(session_id)
@@ -35,10 +107,31 @@ class MemoryManager:
         self.short.add(session_id, "user", user_msg)
         self.short.add(session_id, "assistant", assistant_msg)
         if self.long is not None:
-            self.long.store(
-                f"User: {user_msg}\nAssistant: {assistant_msg}",
-                metadata={"session_id": session_id},
-            )
+            item = (f"User: {user_msg}\nAssistant: {assistant_msg}", {"session_id": session_id})
+            if self._writer is not None:
+                self._write_q.put(item)
+            else:
+                self.long.store(*item)
+
+    def flush(self) -> None:
+        """Wait for queued writes, then write any buffered long-term entries to storage."""
+        if self._writer is not None:
+            self._write_q.join()
+        if self.long is not None:
+            self.long.flush()
+
+    def close(self) -> None:
+        """Drain and stop the background writer, then flush long-term memory.
+
+        Safe to call more than once; later writes are stored synchronously.
+        """
+        _open_managers.discard(self)
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            self._write_q.put(None)
+            writer.join()
+        if self.long is not None:
+            self.long.flush()
 
     def search_memory(self, query: str, n_results: int = 5) -> list[dict]:
         """Search long-term memory; returns [] if unavailable."""
@@ -59,11 +152,8 @@ class MemoryManager:
         if not memories:
             return short_ctx
 
-        memory_text = "\n".join(
-            f"[Memory {i + 1}]: {m['text']}" for i, m in enumerate(memories)
-        )
         memory_message: dict = {
             "role": "system",
-            "content": f"Relevant past interactions:\n{memory_text}",
+            "content": _format_memories(tuple(m["text"] for m in memories)),
         }
         return [memory_message] + short_ctx
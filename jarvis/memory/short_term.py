@@ -2,7 +2,25 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import sys
+from collections import deque
+
+_SYSTEM = sys.intern("system")
+
+
+class _Session:
+    """History of one session, stored as parallel columns rather than per-message dicts.
+
+    System messages are pinned; the rest live in a pair of deques bounded by the
+    remaining window budget.
+    """
+
+    __slots__ = ("system", "roles", "contents")
+
+    def __init__(self, budget: int) -> None:
+        self.system: list[str] = []
+        self.roles: deque[str] = deque(maxlen=budget)
+        self.contents: deque[str] = deque(maxlen=budget)
 
 
 class ShortTermMemory:
@@ -13,33 +31,43 @@ class ShortTermMemory:
 
     def __init__(self, limit: int = 20) -> None:
         self._limit = max(1, limit)
-        self._store: dict[str, deque[dict]] = defaultdict(lambda: deque())
+        self._store: dict[str, _Session] = {}
+
+    def _session(self, session_id: str) -> _Session:
+        session = self._store.get(session_id)
+        if session is None:
+            session = self._store[session_id] = _Session(self._limit)
+        return session
 
     def add(self, session_id: str, role: str, content: str) -> None:
-        """Add a message to the session history."""
-        buf = self._store[session_id]
-        buf.append({"role": role, "content": content})
-        self._trim(session_id)
+        """Add a message to the session history.
+
+        Non-system messages go into deques bounded by ``limit`` minus the number of
+        system messages, so the oldest ones fall off without rebuilding the history.
+        """
+        session = self._session(session_id)
+        if role != _SYSTEM:
+            session.roles.append(sys.intern(role))
+            session.contents.append(content)
+            return
+        session.system.append(content)
+        budget = max(0, self._limit - len(session.system))
+        if session.roles.maxlen != budget:
+            session.roles = deque(session.roles, maxlen=budget)
+            session.contents = deque(session.contents, maxlen=budget)
 
     def get_context(self, session_id: str) -> list[dict]:
-        """Return all messages in OpenAI message format."""
-        return list(self._store[session_id])
+        """Return all messages in OpenAI message format, system messages first."""
+        session = self._store.get(session_id)
+        if session is None:
+            return []
+        context = [{"role": _SYSTEM, "content": content} for content in session.system]
+        context.extend(
+            {"role": role, "content": content}
+            for role, content in zip(session.roles, session.contents)
+        )
+        return context
 
     def clear(self, session_id: str) -> None:
         """Clear all messages for a session."""
         self._store.pop(session_id, None)
-
-    def _trim(self, session_id: str) -> None:
-        """Keep only the most recent messages, always preserving system messages."""
-        buf = self._store[session_id]
-        if len(buf) <= self._limit:
-            return
-
-        system_msgs = [m for m in buf if m["role"] == "system"]
-        non_system = [m for m in buf if m["role"] != "system"]
-
-        # Keep the most recent non-system messages within the budget
-        budget = max(0, self._limit - len(system_msgs))
-        trimmed_non_system = non_system[-budget:] if budget > 0 else []
-
-        self._store[session_id] = deque(system_msgs + trimmed_non_system)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import io
 import math
-import wave
+from collections.abc import Callable
 from typing import Any
 
+from jarvis.voice.wav import wav_header
+
 
 class AudioStream:
     """Real-time microphone input powered by sounddevice."""
@@ -71,11 +72,19 @@ class AudioStream:
         silence_threshold: float = 0.01,
         silence_duration: float = 1.5,
         max_duration: float = 30.0,
+        on_chunk: Callable[[bytes], Any] | None = None,
     ) -> bytes:
         """Record from microphone until silence is detected.
 
         Uses RMS energy to detect silence.
 
+        Args:
+            silence_threshold: RMS level (0-1) below which a chunk counts as silent.
+            silence_duration: Seconds of continuous silence that end the recording.
+            max_duration: Hard limit on the recording length in seconds.
+            on_chunk: Called with each chunk's PCM bytes as soon as it is captured,
+                e.g. to feed a streaming recognizer while recording continues.
+
         Returns:
             Raw PCM int16 bytes.
         """
@@ -86,7 +95,13 @@ class AudioStream:
         max_frames = int(self._sample_rate * max_duration)
         silence_frames_needed = int(silence_duration / self._chunk_duration)
 
-        frames: list[Any] = []
+        # rms < threshold  <=>  sum(x^2) < (threshold * 32768)^2 * n_samples, so the
+        # per-chunk test is one integer compare against a precomputed limit
+        per_sample_limit = (silence_threshold * 32768.0) ** 2
+        chunk_limit = math.ceil(per_sample_limit * chunk_frames * self._channels)
+
+        # One buffer for the whole recording; chunks are copied in at a moving offset
+        buf = np.empty((max_frames, self._channels), dtype=np.int16)
         silent_chunks = 0
         total_frames = 0
 
@@ -97,13 +112,21 @@ class AudioStream:
             blocksize=chunk_frames,
         ) as stream:
             while total_frames < max_frames:
-                chunk, _ = stream.read(chunk_frames)
-                frames.append(chunk.copy())
-                total_frames += chunk_frames
-
-                # Compute RMS energy
-                rms = math.sqrt(np.mean(chunk.astype(np.float32) ** 2)) / 32768.0
-                if rms < silence_threshold:
+                chunk, _ = stream.read(min(chunk_frames, max_frames - total_frames))
+                n = chunk.shape[0]
+                buf[total_frames : total_frames + n] = chunk
+                total_frames += n
+                if on_chunk is not None:
+                    on_chunk(chunk.tobytes())
+
+                # Energy as an integer sum of squares (int64 avoids int16 overflow)
+                samples = chunk.reshape(-1).astype(np.int64)
+                limit = (
+                    chunk_limit
+                    if n == chunk_frames
+                    else math.ceil(per_sample_limit * samples.size)
+                )
+                if int(np.dot(samples, samples)) < limit:
                     silent_chunks += 1
                 else:
                     silent_chunks = 0
@@ -111,10 +134,7 @@ class AudioStream:
                 if silent_chunks >= silence_frames_needed and total_frames > chunk_frames:
                     break
 
-        if not frames:
-            return b""
-        audio = np.concatenate(frames, axis=0)
-        return audio.tobytes()
+        return buf[:total_frames].tobytes()
 
     def save_wav(self, audio_data: bytes, file_path: str, sample_rate: int = 16000) -> str:
         """Save PCM int16 *audio_data* to *file_path* as a WAV file.
@@ -122,19 +142,11 @@ class AudioStream:
         Returns:
             file_path
         """
-        with wave.open(file_path, "wb") as wf:
-            wf.setnchannels(self._channels)
-            wf.setsampwidth(2)  # int16 → 2 bytes
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio_data)
+        with open(file_path, "wb") as fh:
+            fh.write(wav_header(self._channels, sample_rate, len(audio_data)))
+            fh.write(audio_data)
         return file_path
 
     def bytes_to_wav_bytes(self, audio_data: bytes, sample_rate: int = 16000) -> bytes:
         """Convert raw PCM bytes to in-memory WAV bytes."""
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(self._channels)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio_data)
-        return buf.getvalue()
+        return wav_header(self._channels, sample_rate, len(audio_data)) + audio_data
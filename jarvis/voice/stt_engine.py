@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
-from typing import TYPE_CHECKING
+import threading
+import wave
+from typing import TYPE_CHECKING, Any
+
+from jarvis.voice.wav import WAV_HEADER, parse_wav_header
 
 if TYPE_CHECKING:
     pass
 
 _DEFAULT_MODEL_PATH = "./models/vosk-model-small-en-us"
+_FEED_CHUNK = 64 * 1024  # bytes handed to the recognizer per AcceptWaveform call
 
 
 class STTEngine:
@@ -20,27 +26,66 @@ class STTEngine:
         self._sample_rate = sample_rate
         self._model = None
         self._vosk = None
+        # One reusable recognizer at the engine's sample rate; the lock marks it in use
+        self._rec: Any = None
+        self._rec_lock = threading.Lock()
+        self._load_lock = threading.Lock()
 
     def _load(self) -> None:
-        """Lazy-load Vosk model."""
+        """Lazy-load Vosk model (thread-safe; concurrent callers wait for one load)."""
         if self._model is not None:
             return
-        try:
-            import vosk  # type: ignore[import]
-        except ImportError as exc:
-            raise RuntimeError(
-                "vosk is not installed. Run: pip install 'jarvis-x[voice]'"
-            ) from exc
+        with self._load_lock:
+            if self._model is not None:
+                return
+            try:
+                import vosk  # type: ignore[import]
+            except ImportError as exc:
+                raise RuntimeError(
+                    "vosk is not installed. Run: pip install 'jarvis-x[voice]'"
+                ) from exc
+
+            if not os.path.isdir(self._model_path):
+                raise RuntimeError(
+                    f"Vosk model not found at '{self._model_path}'. "
+                    "Run: bash scripts/download_vosk_model.sh"
+                )
+
+            vosk.SetLogLevel(-1)
+            model = vosk.Model(self._model_path)
+            self._vosk = vosk
+            self._rec = vosk.KaldiRecognizer(model, self._sample_rate)
+            # Published last: a non-None model means the engine is fully loaded
+            self._model = model
+
+    def warmup(self) -> None:
+        """Load the Vosk model now instead of on the first transcription.
+
+        Blocks while the model loads; does nothing if STT is unavailable.
+        """
+        if self.is_available():
+            self._load()
 
-        if not os.path.isdir(self._model_path):
-            raise RuntimeError(
-                f"Vosk model not found at '{self._model_path}'. "
-                "Run: bash scripts/download_vosk_model.sh"
-            )
+    def is_loaded(self) -> bool:
+        """Return True once the Vosk model is loaded, without waiting for a load."""
+        return self._model is not None
 
-        vosk.SetLogLevel(-1)
-        self._vosk = vosk
-        self._model = vosk.Model(self._model_path)
+    def _acquire_recognizer(self, sample_rate: int) -> Any:
+        """Return a recognizer ready for a new utterance at *sample_rate*.
+
+        The cached recognizer is reset and reused when it is free and the rate
+        matches; otherwise (concurrent use, other rate) a fresh one is built.
+        Pair every call with :meth:`_release_recognizer`.
+        """
+        assert self._vosk is not None and self._model is not None
+        if sample_rate == self._sample_rate and self._rec_lock.acquire(blocking=False):
+            self._rec.Reset()
+            return self._rec
+        return self._vosk.KaldiRecognizer(self._model, sample_rate)
+
+    def _release_recognizer(self, rec: Any) -> None:
+        if rec is self._rec:
+            self._rec_lock.release()
 
     def is_available(self) -> bool:
         """Return True if Vosk is installed and the model directory exists."""
@@ -61,9 +106,52 @@ class STTEngine:
                 "STT is not available. Install vosk and download the model first."
             )
         self._load()
-        assert self._vosk is not None and self._model is not None
-        rec = self._vosk.KaldiRecognizer(self._model, self._sample_rate)
-        rec.AcceptWaveform(audio_data)
+        rec = self._acquire_recognizer(self._sample_rate)
+        try:
+            rec.AcceptWaveform(audio_data)
+            return self._final_result(rec)
+        finally:
+            self._release_recognizer(rec)
+
+    def start_stream(self, sample_rate: int | None = None) -> Any:
+        """Create a recognizer for incremental decoding with :meth:`feed`.
+
+        Args:
+            sample_rate: Rate of the audio that will be fed; defaults to the engine's rate.
+
+        Returns:
+            An opaque recognizer handle to pass to :meth:`feed` and :meth:`finalize`.
+        """
+        if not self.is_available():
+            raise RuntimeError(
+                "STT is not available. Install vosk and download the model first."
+            )
+        self._load()
+        return self._acquire_recognizer(sample_rate or self._sample_rate)
+
+    def feed(self, rec: Any, audio_data: bytes) -> bool:
+        """Decode a chunk of PCM 16-bit audio as it arrives.
+
+        Returns:
+            True if the recognizer detected the end of an utterance.
+        """
+        return bool(rec.AcceptWaveform(audio_data))
+
+    def finalize(self, rec: Any) -> dict[str, object]:
+        """Flush a streaming recognizer and return its transcription.
+
+        The recognizer must not be used again afterwards.
+
+        Returns:
+            {"text": str, "confidence": float}
+        """
+        try:
+            return self._final_result(rec)
+        finally:
+            self._release_recognizer(rec)
+
+    @staticmethod
+    def _final_result(rec: Any) -> dict[str, object]:
         raw = json.loads(rec.FinalResult())
         text: str = raw.get("text", "")
         confidence: float = raw.get("confidence", 1.0) if text else 0.0
@@ -72,25 +160,41 @@ class STTEngine:
     def transcribe_file(self, file_path: str) -> dict[str, object]:
         """Read a WAV file and transcribe it.
 
+        Canonical PCM files are memory-mapped and fed to the recognizer in slices,
+        so the whole payload is never copied into one bytes object; other layouts
+        are read with the ``wave`` module in chunks.
+
         Returns:
             {"text": str, "confidence": float}
         """
-        import wave
-
         if not self.is_available():
             raise RuntimeError(
                 "STT is not available. Install vosk and download the model first."
             )
         self._load()
-        assert self._vosk is not None and self._model is not None
 
-        with wave.open(file_path, "rb") as wf:
-            sample_rate = wf.getframerate()
-            rec = self._vosk.KaldiRecognizer(self._model, sample_rate)
-            audio_data = wf.readframes(wf.getnframes())
+        with open(file_path, "rb") as fh:
+            header = parse_wav_header(fh.read(WAV_HEADER.size))
+            if header is not None:
+                sample_rate, data_size = header
+                size = os.fstat(fh.fileno()).st_size
+                end = min(size, WAV_HEADER.size + data_size)
+                rec = self._acquire_recognizer(sample_rate)
+                try:
+                    if end > WAV_HEADER.size:
+                        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            for pos in range(WAV_HEADER.size, end, _FEED_CHUNK):
+                                rec.AcceptWaveform(mm[pos : min(pos + _FEED_CHUNK, end)])
+                    return self._final_result(rec)
+                finally:
+                    self._release_recognizer(rec)
 
-        rec.AcceptWaveform(audio_data)
-        raw = json.loads(rec.FinalResult())
-        text: str = raw.get("text", "")
-        confidence: float = raw.get("confidence", 1.0) if text else 0.0
-        return {"text": text, "confidence": confidence}
+        with wave.open(file_path, "rb") as wf:
+            rec = self._acquire_recognizer(wf.getframerate())
+            try:
+                frames_per_chunk = max(1, _FEED_CHUNK // (wf.getsampwidth() * wf.getnchannels()))
+                while data := wf.readframes(frames_per_chunk):
+                    rec.AcceptWaveform(data)
+                return self._final_result(rec)
+            finally:
+                self._release_recognizer(rec)
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import queue
 import threading
+from collections.abc import Callable
+from concurrent.futures import Future
 from typing import Any
 
 
 class TTSEngine:
-    """Offline text-to-speech engine powered by pyttsx3."""
+    """Offline text-to-speech engine powered by pyttsx3.
+
+    pyttsx3 drivers are not thread-safe, so the engine is created and driven by a
+    single worker thread; every operation is queued to it and runs in order.
+    """
 
     def __init__(
         self,
@@ -19,6 +26,10 @@ class TTSEngine:
         self._rate = rate
         self._voice_id = voice_id
         self._engine: Any = None
+        # Work for the speech thread; None tells it to exit
+        self._queue: queue.Queue[tuple[Callable[[], Any], Future[Any]] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
 
     def _load(self) -> None:
         """Lazy-load pyttsx3 engine."""
@@ -36,6 +47,58 @@ class TTSEngine:
         if self._voice_id:
             self._engine.setProperty("voice", self._voice_id)
 
+    def _run(self) -> None:
+        """Speech-thread loop: load the engine on first use and run queued jobs."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                # The engine belongs to this thread; a restarted worker builds its own
+                if self._engine is not None:
+                    try:
+                        self._engine.stop()
+                    except Exception:
+                        pass
+                    self._engine = None
+                return
+            fn, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self._load()
+                future.set_result(fn())
+            except BaseException as exc:
+                future.set_exception(exc)
+
+    def _submit(self, fn: Callable[[], Any]) -> Future[Any]:
+        """Queue *fn* for the speech thread, starting the thread if needed."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="jarvis-tts", daemon=True)
+                self._worker.start()
+            future: Future[Any] = Future()
+            self._queue.put((fn, future))
+        return future
+
+    def warmup(self) -> None:
+        """Start the speech thread and initialize the engine in the background.
+
+        Returns immediately; does nothing if TTS is unavailable.
+        """
+        if self.is_available():
+            self._submit(lambda: None)
+
+    def shutdown(self) -> None:
+        """Finish queued speech, then stop the speech thread and release its engine.
+
+        A later call starts a new speech thread with a fresh engine.
+        """
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            if worker is not None:
+                self._queue.put(None)
+        if worker is not None:
+            worker.join()
+
     def is_available(self) -> bool:
         """Return True if pyttsx3 can be imported successfully."""
         try:
@@ -50,15 +113,23 @@ class TTSEngine:
             raise RuntimeError(
                 "TTS is not available. Run: pip install 'jarvis-x[voice]'"
             )
-        self._load()
-        assert self._engine is not None
+        self._submit(lambda: self._say(text)).result()
+
+    def speak_async(self, text: str) -> None:
+        """Queue *text* on the speech thread and return immediately."""
+        if not self.is_available():
+            raise RuntimeError(
+                "TTS is not available. Run: pip install 'jarvis-x[voice]'"
+            )
+        self._submit(lambda: self._say(text))
+
+    def _say(self, text: str) -> None:
         self._engine.say(text)
         self._engine.runAndWait()
 
-    def speak_async(self, text: str) -> None:
-        """Speak *text* in a background thread (non-blocking)."""
-        thread = threading.Thread(target=self.speak, args=(text,), daemon=True)
-        thread.start()
+    def _save(self, text: str, output_path: str) -> None:
+        self._engine.save_to_file(text, output_path)
+        self._engine.runAndWait()
 
     def save_to_file(self, text: str, output_path: str) -> str:
         """Save speech audio to *output_path* (WAV).
@@ -70,23 +141,20 @@ class TTSEngine:
             raise RuntimeError(
                 "TTS is not available. Run: pip install 'jarvis-x[voice]'"
             )
-        self._load()
-        assert self._engine is not None
-        self._engine.save_to_file(text, output_path)
-        self._engine.runAndWait()
+        self._submit(lambda: self._save(text, output_path)).result()
         return output_path
 
     def set_rate(self, rate: int) -> None:
         """Change speech rate (words per minute)."""
         self._rate = rate
         if self._engine is not None:
-            self._engine.setProperty("rate", rate)
+            self._submit(lambda: self._engine.setProperty("rate", rate))
 
     def set_voice(self, voice_id: str) -> None:
         """Change the active voice by ID."""
         self._voice_id = voice_id
         if self._engine is not None:
-            self._engine.setProperty("voice", voice_id)
+            self._submit(lambda: self._engine.setProperty("voice", voice_id))
 
     def list_voices(self) -> list[dict[str, str]]:
         """Return available voices as a list of dicts.
@@ -98,9 +166,7 @@ class TTSEngine:
             raise RuntimeError(
                 "TTS is not available. Run: pip install 'jarvis-x[voice]'"
             )
-        self._load()
-        assert self._engine is not None
-        voices = self._engine.getProperty("voices")
+        voices = self._submit(lambda: self._engine.getProperty("voices")).result()
         result: list[dict[str, str]] = []
         for v in voices:
             lang = ""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import uuid
 from typing import TYPE_CHECKING
 
@@ -62,21 +63,55 @@ class VoiceAssistant:
             "microphone": self._audio.is_available(),
         }
 
+    def prewarm(self) -> None:
+        """Load the STT model and TTS engine in the background.
+
+        Both loads overlap with each other and with the first recording (audio is
+        buffered until the STT model is ready), so the first turn does not pay the
+        full model start-up cost. Returns immediately.
+        """
+        threading.Thread(target=self._stt.warmup, name="jarvis-stt-warmup", daemon=True).start()
+        self._tts.warmup()
+
     async def listen_and_respond(self) -> dict[str, str]:
         """One full voice turn: record → transcribe → AI response → speak.
 
         Returns:
             {"user_text": str, "response": str, "model_used": str}
         """
-        # 1. Record audio
-        audio_data = self._audio.record_until_silence(
-            silence_threshold=self._silence_threshold,
-            silence_duration=self._silence_duration,
-            max_duration=self._max_record_duration,
-        )
+        # 1-2. Record audio, decoding each chunk while capture continues. Capture
+        # starts at once; chunks are held back until a background model load
+        # finishes, then the recognizer catches up on them.
+        rec = None
+        backlog: list[bytes] = []
+
+        def on_chunk(chunk: bytes) -> None:
+            nonlocal rec
+            if rec is None:
+                if not self._stt.is_loaded():
+                    backlog.append(chunk)
+                    return
+                rec = self._stt.start_stream()
+                for held in backlog:
+                    self._stt.feed(rec, held)
+                backlog.clear()
+            self._stt.feed(rec, chunk)
 
-        # 2. Transcribe
-        stt_result = self._stt.transcribe_audio(audio_data)
+        try:
+            self._audio.record_until_silence(
+                silence_threshold=self._silence_threshold,
+                silence_duration=self._silence_duration,
+                max_duration=self._max_record_duration,
+                on_chunk=on_chunk,
+            )
+            if rec is None:
+                # Recording ended before the model was ready: wait for it now
+                rec = self._stt.start_stream()
+                for held in backlog:
+                    self._stt.feed(rec, held)
+        finally:
+            # Always finalize so the engine's shared recognizer is released
+            stt_result = self._stt.finalize(rec) if rec is not None else {"text": ""}
         user_text: str = str(stt_result.get("text", "")).strip()
 
         if not user_text:
@@ -110,6 +145,7 @@ class VoiceAssistant:
             "[dim]Say 'exit', 'quit', or 'chiqish' to stop.[/dim]"
         )
 
+        self.prewarm()
         try:
             while True:
                 console.print("\n[bold yellow]🎤 Listening…[/bold yellow]")
@@ -0,0 +1,48 @@
+"""Canonical 16-bit PCM WAV header, shared by the audio writer and the STT reader."""
+
+from __future__ import annotations
+
+import struct
+
+# Canonical 44-byte header: RIFF, fmt (16 bytes), then the data chunk
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def wav_header(channels: int, sample_rate: int, nbytes: int) -> bytes:
+    """Build the WAV header for *nbytes* of int16 PCM audio."""
+    block_align = channels * 2
+    return WAV_HEADER.pack(
+        b"RIFF",
+        36 + nbytes,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,  # byte rate
+        block_align,
+        16,  # bits per sample
+        b"data",
+        nbytes,
+    )
+
+
+def parse_wav_header(header: bytes) -> tuple[int, int] | None:
+    """Return (sample_rate, data_size) for a canonical 16-bit PCM WAV header, else None."""
+    if len(header) < WAV_HEADER.size:
+        return None
+    fields = WAV_HEADER.unpack(header)
+    riff, wave_id, fmt_id, fmt_size, audio_format = fields[0], *fields[2:6]
+    sample_rate, bits, data_id, data_size = fields[7], *fields[10:13]
+    if (
+        riff != b"RIFF"
+        or wave_id != b"WAVE"
+        or fmt_id != b"fmt "
+        or fmt_size != 16
+        or audio_format != 1
+        or bits != 16
+        or data_id != b"data"
+    ):
+        return None
+    return sample_rate, data_size
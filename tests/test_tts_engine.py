@@ -0,0 +1,62 @@
+"""Tests for the single-threaded TTS engine."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import types
+
+import pytest
+
+from jarvis.voice.tts_engine import TTSEngine
+
+
+class _ThreadBoundEngine:
+    """pyttsx3 stand-in that fails if used from a thread other than its creator."""
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.spoken: list[str] = []
+
+    def _check(self) -> None:
+        assert threading.get_ident() == self.owner, "engine used from a foreign thread"
+
+    def setProperty(self, name: str, value: object) -> None:  # noqa: N802
+        self._check()
+
+    def say(self, text: str) -> None:
+        self._check()
+        self.spoken.append(text)
+
+    def runAndWait(self) -> None:  # noqa: N802
+        self._check()
+
+    def stop(self) -> None:
+        self._check()
+
+
+@pytest.fixture
+def engines(monkeypatch: pytest.MonkeyPatch) -> list[_ThreadBoundEngine]:
+    created: list[_ThreadBoundEngine] = []
+
+    def init() -> _ThreadBoundEngine:
+        engine = _ThreadBoundEngine()
+        created.append(engine)
+        return engine
+
+    monkeypatch.setitem(sys.modules, "pyttsx3", types.SimpleNamespace(init=init))
+    return created
+
+
+def test_speak_after_shutdown_uses_a_fresh_engine(engines: list[_ThreadBoundEngine]) -> None:
+    tts = TTSEngine()
+    tts.speak("one")
+    tts.shutdown()
+
+    tts.speak("two")
+    tts.speak("three")
+    tts.shutdown()
+
+    assert len(engines) == 2
+    assert engines[0].spoken == ["one"]
+    assert engines[1].spoken == ["two", "three"]